@@ -6,11 +6,9 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import os
+import hashlib
 import warnings
-from statsmodels.tsa.arima.model import ARIMA
-from scipy.optimize import minimize
 from dotenv import load_dotenv
-from openai import OpenAI
 
 # Suppress warnings for a professional console output
 warnings.filterwarnings("ignore")
@@ -18,6 +16,9 @@ warnings.filterwarnings("ignore")
 # -------------------------------------------------
 # PAGE CONFIG & THEME
 # -------------------------------------------------
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+THEME_PATH = os.path.join(BASE_DIR, "assets", "theme.css")
+
 st.set_page_config(
     page_title="AQUA NEXUS | Intelligent Reservoir AI",
     page_icon="💧",
@@ -25,125 +26,283 @@ st.set_page_config(
 )
 
 # High-Class Custom CSS for Glassmorphism, Premium Hover, and Engineering UI
-st.markdown("""
-    <style>
-    /* Main Background */
-    .stApp {
-        background-color: #0a0e14;
-        color: #e0e6ed;
-    }
-    
-    /* Metric Card Styling */
-    div[data-testid="metric-container"] {
-        background-color: #161b22;
-        border: 1px solid #30363d;
-        padding: 20px;
-        border-radius: 12px;
-        box-shadow: 0 4px 10px rgba(0,0,0,0.3);
-    }
-    div[data-testid="stMetricValue"] {
-        color: #00d4ff;
-        font-weight: 700;
-    }
-    
-    /* Custom Header Gradient */
-    .main-header {
-        background: linear-gradient(90deg, #001529 0%, #003366 100%);
-        padding: 25px;
-        border-radius: 15px;
-        border-left: 10px solid #00d4ff;
-        margin-bottom: 30px;
-    }
-    
-    /* AI Report Text Box */
-    .ai-report-box {
-        background-color: #161b22;
-        padding: 25px;
-        border-radius: 12px;
-        border: 1px solid #30363d;
-        line-height: 1.6;
-        font-size: 1.05rem;
-    }
-    
-    /* HIGH-CLASS BUTTON HOVER EFFECTS */
-    .stButton>button {
-        width: 100%;
-        border-radius: 8px;
-        background-color: #00d4ff;
-        color: #0a0e14 !important;
-        font-weight: bold;
-        height: 3.5em;
-        border: none;
-        transition: all 0.3s ease-in-out;
-        box-shadow: 0 4px 15px rgba(0, 212, 255, 0.2);
-        cursor: pointer;
-    }
-
-    .stButton>button:hover {
-        background-color: #ffffff !important;
-        color: #00d4ff !important;
-        border: 2px solid #00d4ff;
-        box-shadow: 0 0 25px rgba(0, 212, 255, 0.6);
-        transform: translateY(-3px); /* Subtle lift effect */
-    }
-
-    .stButton>button:active {
-        transform: translateY(1px);
-    }
-    </style>
-    """, unsafe_allow_html=True)
+@st.cache_resource(show_spinner=False)
+def load_theme_css(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+st.markdown(f"<style>{load_theme_css(THEME_PATH)}</style>", unsafe_allow_html=True)
 
 # -------------------------------------------------
 # LOAD ENV + LLM CLIENT
 # -------------------------------------------------
-load_dotenv()
-client = OpenAI(
-    base_url="https://api.featherless.ai/v1",
-    api_key=os.getenv("FEATHERLESS_API_KEY"),
-)
+@st.cache_resource(show_spinner=False)
+def get_llm_client():
+    from openai import OpenAI  # deferred: only needed once a report is requested
+    
+    load_dotenv()
+    return OpenAI(
+        base_url="https://api.featherless.ai/v1",
+        api_key=os.getenv("FEATHERLESS_API_KEY"),
+    )
+
+def build_briefing_prompt(reservoir, state, current_storage, utilization, risk_status, projected_pct, months):
+    return f"""
+    Act as a Senior Hydrological Engineer. Provide a briefing for:
+    Reservoir: {reservoir}, State: {state}
+    Current: {current_storage} BCM ({utilization:.1f}% full).
+    Risk: {risk_status}. Forecast: {projected_pct:.1f}% in {months} months.
+
+    Provide 4 structured sections:
+    1. 📊 SITUATION: Current state analysis.
+    2. 🔍 PREDICTIVE: Implications of the {projected_pct:.1f}% projection.
+    3. ⚙️ OPERATIONAL: Gate/Release recommendations.
+    4. ⚠️ SUMMARY: Final security statement.
+    """
+
+def stream_briefing(prompt):
+    client = get_llm_client()
+    response = client.chat.completions.create(
+        model="Qwen/Qwen2.5-7B-Instruct",
+        messages=[{"role": "user", "content": prompt}],
+        stream=True
+    )
+    for chunk in response:
+        if chunk.choices:
+            yield chunk.choices[0].delta.content or ""
 
 # -------------------------------------------------
 # DATA LOADING & CLEANING
 # -------------------------------------------------
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 RES_PATH = os.path.join(BASE_DIR, "data", "cwc_reservoirs.xlsx")
 RAIN_PATH = os.path.join(BASE_DIR, "data", "climate.xlsx")
 COLLECTOR_PATH = os.path.join(BASE_DIR, "data", "india_district_collectors.csv")
 
-@st.cache_data
-def load_and_clean_data():
-    if not os.path.exists(RES_PATH) or not os.path.exists(RAIN_PATH):
-        return None, None, None
+# Columnar copies written by scripts/convert_to_parquet.py (preferred when present)
+RES_PARQUET_PATH = os.path.join(BASE_DIR, "data", "cwc_reservoirs.parquet")
+RAIN_PARQUET_PATH = os.path.join(BASE_DIR, "data", "climate.parquet")
+RES_COLUMNS = ["DATE", "REGION", "STATE", "RESERVOIR", "CURRENT STORAGE BCM", "FULL RESERVOIR LEVEL BCM"]
+RAIN_COLUMNS = ["CWC Region", "Rainfall Actual (mm)"]
+
+# Cleaned frames, rebuilt whenever the source file is newer. Bump the version
+# whenever clean_reservoirs/clean_climate change so stale caches are skipped.
+CLEAN_CACHE_VERSION = 3
+RES_CACHE_PATH = os.path.join(BASE_DIR, "data", f"_cwc_cache_v{CLEAN_CACHE_VERSION}.parquet")
+RAIN_CACHE_PATH = os.path.join(BASE_DIR, "data", f"_climate_cache_v{CLEAN_CACHE_VERSION}.parquet")
+
+def read_workbook(path):
+    # calamine parses xlsx far faster than openpyxl; fall back if the wheel is missing
+    # (ImportError) or pandas predates the engine (ValueError, pandas < 2.2)
+    try:
+        return pd.read_excel(path, engine="calamine")
+    except (ImportError, ValueError):
+        return pd.read_excel(path)
+
+def pick_source(path, parquet_path):
+    # The Parquet copy only stands in for the workbook while it is up to date
+    if os.path.exists(parquet_path) and (
+        not os.path.exists(path) or os.path.getmtime(parquet_path) >= os.path.getmtime(path)
+    ):
+        return parquet_path
+    return path
+
+def read_source(path, columns):
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, columns=columns)
+    return read_workbook(path)
+
+def load_clean_frame(source_path, cache_path, columns, clean):
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(source_path):
+        cached = pd.read_parquet(cache_path)
+        if list(cached.columns) == list(columns):
+            return cached
+    
+    df = clean(read_source(source_path, columns))[columns]
+    try:
+        df.to_parquet(cache_path, index=False)
+    except OSError:
+        pass  # read-only deploys simply re-clean on the next cold start
+    return df
+
+def normalize_labels(col):
+    # Strip/title-case each distinct label once, then remap the codes
+    cat = col.astype(str).astype("category")
+    cleaned = cat.cat.categories.str.strip().str.title()
+    if cleaned.is_unique:
+        return cat.cat.rename_categories(cleaned)
+    # Labels differing only in whitespace/case collapse onto one category
+    merged = cleaned.unique()
+    remap = merged.get_indexer(cleaned)
+    codes = cat.cat.codes.to_numpy()
+    codes = np.where(codes >= 0, remap[codes], -1)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=merged), index=col.index)
+
+def clean_reservoirs(res):
+    res.columns = res.columns.str.strip()
+    
+    # CWC bulletins use ISO dates; an explicit format skips per-value inference
+    res["DATE"] = pd.to_datetime(res["DATE"], format="%Y-%m-%d", cache=True, errors="coerce")
+    # Undated rows would sort last and masquerade as the latest bulletin
+    res = res.dropna(subset=["DATE"])
+    res["CURRENT STORAGE BCM"] = pd.to_numeric(res["CURRENT STORAGE BCM"], errors="coerce").astype("float32")
+    res["FULL RESERVOIR LEVEL BCM"] = pd.to_numeric(res["FULL RESERVOIR LEVEL BCM"], errors="coerce").astype("float32")
+    
+    for col in ["REGION", "STATE", "RESERVOIR"]:
+        res[col] = normalize_labels(res[col])
+    
+    return res
+
+def clean_climate(rain):
+    rain.columns = rain.columns.str.strip()
+    
+    rain["CWC Region"] = normalize_labels(rain["CWC Region"])
+    rain["Rainfall Actual (mm)"] = pd.to_numeric(rain["Rainfall Actual (mm)"], errors="coerce").astype("float32")
+    
+    return rain
+
+@st.cache_data(ttl="1h", show_spinner=False)
+def load_reservoirs(path, parquet_path):
+    source = pick_source(path, parquet_path)
+    if not os.path.exists(source):
+        return None
+    
+    res = load_clean_frame(source, RES_CACHE_PATH, RES_COLUMNS, clean_reservoirs)
+    
+    # Resolve the REGION > STATE > RESERVOIR hierarchy once into hash lookups,
+    # keys and option lists pre-sorted so the sidebar only indexes them
+    region_to_states = {k: sorted(v) for k, v in sorted(res.groupby("REGION", observed=True)["STATE"].unique().items())}
+    state_to_reservoirs = {k: sorted(v) for k, v in sorted(res.groupby("STATE", observed=True)["RESERVOIR"].unique().items())}
+    reservoir_to_df = {k: g.sort_values("DATE") for k, g in res.groupby("RESERVOIR", observed=True)}
+    
+    # Latest-bulletin KPIs per reservoir: (current storage, capacity, utilization %)
+    reservoir_kpis = {}
+    for k, g in reservoir_to_df.items():
+        cs = g["CURRENT STORAGE BCM"].iat[-1]
+        cap = g["FULL RESERVOIR LEVEL BCM"].iat[-1]
+        reservoir_kpis[k] = (cs, cap, (cs / cap) * 100)
+    
+    return region_to_states, state_to_reservoirs, reservoir_to_df, reservoir_kpis
+
+@st.cache_data(ttl="1h", show_spinner=False)
+def load_climate(path, parquet_path):
+    source = pick_source(path, parquet_path)
+    if not os.path.exists(source):
+        return None
+    
+    return load_clean_frame(source, RAIN_CACHE_PATH, RAIN_COLUMNS, clean_climate)
+
+@st.cache_data(ttl="1h", show_spinner=False)
+def load_collectors(path):
+    if not os.path.exists(path):
+        return None
     
-    res = pd.read_excel(RES_PATH)
-    rain = pd.read_excel(RAIN_PATH)
+    coll = pd.read_csv(path)
+    coll.columns = coll.columns.str.strip()
     
-    for df in [res, rain]:
-        df.columns = df.columns.str.strip()
+    # KEY ERROR FIX: Dynamic column identification
+    possible_state_cols = ["State", "STATE", "State Name", "State/UT"]
+    actual_state_col = next((c for c in possible_state_cols if c in coll.columns), None)
+    if actual_state_col is None:
+        return {}
     
-    res["REGION"] = res["REGION"].astype(str).str.strip().str.title()
-    res["STATE"] = res["STATE"].astype(str).str.strip().str.title()
-    res["RESERVOIR"] = res["RESERVOIR"].astype(str).str.strip().str.title()
-    res["DATE"] = pd.to_datetime(res["DATE"])
-    res["CURRENT STORAGE BCM"] = pd.to_numeric(res["CURRENT STORAGE BCM"], errors="coerce")
-    res["FULL RESERVOIR LEVEL BCM"] = pd.to_numeric(res["FULL RESERVOIR LEVEL BCM"], errors="coerce")
+    # First collector listed per state, keyed by the dashboard's title-cased state name
+    states = coll[actual_state_col].astype(str).str.strip().str.title()
+    if "Collector Name" in coll.columns:
+        names = coll["Collector Name"]
+    else:
+        names = pd.Series("District Collector", index=coll.index)
+    first = ~states.duplicated()
+    
+    return dict(zip(states[first], names[first]))
+
+# -------------------------------------------------
+# FORECAST MODEL
+# -------------------------------------------------
+@st.cache_resource(max_entries=64, show_spinner=False)
+def fit_arima(series_bytes, order=(1,1,1)):
+    from statsmodels.tsa.arima.model import ARIMA  # deferred: heavy import, short-series fallback only
+    
+    # Shared fitted result: only forecast() is called on it, never mutated
+    return ARIMA(np.frombuffer(series_bytes, dtype=np.float32), order=order).fit()
+
+def fast_arima111_forecast(y, h):
+    # AR(1) on first differences (least squares through the origin), integrated back to levels
+    dy = np.diff(y)
+    denom = np.dot(dy[:-1], dy[:-1])
+    phi = np.dot(dy[:-1], dy[1:]) / denom if denom > 0 else 0.0
+    phi = float(np.clip(phi, -0.99, 0.99))
+    dy_hat = dy[-1] * phi ** np.arange(1, h + 1)
+    return y[-1] + np.cumsum(dy_hat)
+
+def forecast_storage(series, steps):
+    # Bulletin storage carries a few significant digits; float32 is well within noise
+    y = np.asarray(series, dtype=np.float32)
+    if len(y) < 10:
+        return fit_arima(y.tobytes(), order=(1,1,1)).forecast(steps=steps)
+    return fast_arima111_forecast(y, steps)
+
+# -------------------------------------------------
+# FORECAST FIGURE
+# -------------------------------------------------
+MAX_PLOT_POINTS = 500
+
+BASE_LAYOUT = dict(
+    template="plotly_dark", 
+    paper_bgcolor='rgba(0,0,0,0)', 
+    plot_bgcolor='rgba(0,0,0,0)', 
+    margin=dict(l=0,r=0,t=20,b=0),
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+)
+
+def lttb_downsample(x, y, n_out=MAX_PLOT_POINTS):
+    # Largest-Triangle-Three-Buckets: keeps the visual shape with at most n_out points
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return x, y
     
-    rain["CWC Region"] = rain["CWC Region"].astype(str).str.strip().str.title()
-    rain["Rainfall Actual (mm)"] = pd.to_numeric(rain["Rainfall Actual (mm)"], errors="coerce")
+    edges = np.append(np.linspace(1, n - 1, n_out - 1).astype(int), n)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        avg_x = x[edges[i + 1]:edges[i + 2]].mean()
+        avg_y = y[edges[i + 1]:edges[i + 2]].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+# cache_resource hands back the shared Figure; st.plotly_chart only reads it,
+# whereas cache_data would re-validate it on every unpickle
+@st.cache_resource(max_entries=64, show_spinner=False)
+def build_forecast_fig(history, forecast):
+    # float32 values halve the typed-array payload shipped to the browser
+    # (plotly already packs the integer x positions into the narrowest int type)
+    hist_x, hist_y = lttb_downsample(np.arange(len(history)), np.asarray(history, dtype=np.float32))
+    proj_x = np.arange(len(history)-1, len(history)-1+len(forecast))
+    proj_y = np.asarray(forecast, dtype=np.float32)
     
-    coll = None
-    if os.path.exists(COLLECTOR_PATH):
-        coll = pd.read_csv(COLLECTOR_PATH)
-        coll.columns = coll.columns.str.strip()
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=hist_x, y=hist_y, name="Historical", line=dict(color='#00d4ff', width=3)))
+    fig.add_trace(go.Scattergl(x=proj_x, y=proj_y, name="AI Projection", line=dict(color='#ff4b4b', dash='dot', width=3)))
     
-    return res, rain, coll
+    fig.update_layout(**BASE_LAYOUT, height=400)
+    return fig
 
-res_df_full, rain_df_full, collectors_df = load_and_clean_data()
+# -------------------------------------------------
+# LOAD ASSETS
+# -------------------------------------------------
+res_lookup = load_reservoirs(RES_PATH, RES_PARQUET_PATH)
+rain_df_full = load_climate(RAIN_PATH, RAIN_PARQUET_PATH)
+collectors_by_state = load_collectors(COLLECTOR_PATH)
 
-if res_df_full is None:
+if res_lookup is None or rain_df_full is None:
     st.error("Critical Data Assets Missing from /data directory.")
     st.stop()
 
+region_to_states, state_to_reservoirs, reservoir_to_df, reservoir_kpis = res_lookup
+
 # -------------------------------------------------
 # SIDEBAR CONTROL CENTER
 # -------------------------------------------------
@@ -152,13 +311,13 @@ with st.sidebar:
     st.title("Command Center")
     st.markdown("---")
     
-    regions = sorted(res_df_full["REGION"].dropna().unique())
+    regions = list(region_to_states)
     sel_region = st.selectbox("Geographic Region", regions)
     
-    states = sorted(res_df_full[res_df_full["REGION"] == sel_region]["STATE"].dropna().unique())
+    states = region_to_states[sel_region]
     sel_state = st.selectbox("State Territory", states)
     
-    res_list = sorted(res_df_full[res_df_full["STATE"] == sel_state]["RESERVOIR"].dropna().unique())
+    res_list = state_to_reservoirs[sel_state]
     sel_res = st.selectbox("Select Reservoir Asset", res_list)
     
     st.markdown("---")
@@ -168,11 +327,8 @@ with st.sidebar:
 # -------------------------------------------------
 # CALCULATIONS
 # -------------------------------------------------
-res_df = res_df_full[res_df_full["RESERVOIR"] == sel_res].sort_values("DATE")
-latest = res_df.iloc[-1]
-current_storage = latest["CURRENT STORAGE BCM"]
-capacity = latest["FULL RESERVOIR LEVEL BCM"]
-utilization = (current_storage / capacity) * 100
+res_df = reservoir_to_df[sel_res]
+current_storage, capacity, utilization = reservoir_kpis[sel_res]
 
 # -------------------------------------------------
 # MAIN DASHBOARD UI
@@ -200,35 +356,27 @@ col_chart, col_risk = st.columns([2, 1])
 with col_chart:
     st.subheader("📈 Predictive Storage Optimization")
     
-    res_df["Month"] = res_df["DATE"].dt.month
-    res_df["Year"] = res_df["DATE"].dt.year
-    monthly_storage = res_df.groupby(["Year", "Month"])["CURRENT STORAGE BCM"].mean().reset_index()
+    monthly_storage = (
+        res_df.set_index("DATE")["CURRENT STORAGE BCM"]
+        .resample("MS").mean()
+        .dropna()
+    )
     
     try:
-        model = ARIMA(monthly_storage["CURRENT STORAGE BCM"], order=(1,1,1))
-        fit = model.fit()
-        forecast = fit.forecast(steps=f_months)
+        forecast = forecast_storage(monthly_storage.to_numpy(), f_months)
     except:
-        forecast = pd.Series([current_storage] * f_months)
+        forecast = np.full(f_months, current_storage)
 
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(y=monthly_storage["CURRENT STORAGE BCM"].tail(12), name="Historical (12m)", line=dict(color='#00d4ff', width=3)))
-    fig.add_trace(go.Scatter(x=list(range(11, 11+f_months)), y=forecast, name="AI Projection", line=dict(color='#ff4b4b', dash='dot', width=3)))
-    
-    fig.update_layout(
-        template="plotly_dark", 
-        paper_bgcolor='rgba(0,0,0,0)', 
-        plot_bgcolor='rgba(0,0,0,0)', 
-        height=400, 
-        margin=dict(l=0,r=0,t=20,b=0),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    fig = build_forecast_fig(
+        monthly_storage.to_numpy(),
+        forecast
     )
-    st.plotly_chart(fig, width="stretch")
+    st.plotly_chart(fig, width="stretch", key="forecast_chart")
 
 with col_risk:
     st.subheader("🚨 Risk Assessment")
     
-    final_proj = forecast.iloc[-1] if hasattr(forecast, 'iloc') else forecast[-1]
+    final_proj = forecast[-1]
     proj_pct = (final_proj / capacity) * 100
     
     if proj_pct > 85:
@@ -246,62 +394,70 @@ with col_risk:
 # -------------------------------------------------
 # AI & ADMINISTRATIVE PROTOCOLS
 # -------------------------------------------------
-st.markdown("---")
-c_alert, c_ai = st.columns(2)
-
-with c_alert:
-    st.subheader("📢 Administrative Protocol")
-    if collectors_df is not None and risk_status != "SAFE":
+@st.fragment
+def admin_protocol_panel(data_payload):
+    if collectors_by_state is not None and data_payload["risk_status"] != "SAFE":
         
-        # KEY ERROR FIX: Dynamic column identification
-        possible_state_cols = ["State", "STATE", "State Name", "State/UT"]
-        actual_state_col = next((c for c in possible_state_cols if c in collectors_df.columns), None)
-
-        if actual_state_col:
-            collector_row = collectors_df[collectors_df[actual_state_col].astype(str).str.title() == sel_state]
+        if collectors_by_state:
+            c_name = collectors_by_state.get(data_payload["state"])
             
-            if not collector_row.empty:
-                c_name = collector_row.iloc[0].get("Collector Name", "District Collector")
+            if c_name is not None:
                 st.warning(f"Protocol: High-Priority Alert generated for {c_name}")
                 
                 alert_code = f"""
                 [EMERGENCY PROTOCOL ACTIVE]
-                ASSET: {sel_res} | RISK: {risk_status}
-                CURRENT UTIL: {utilization:.1f}%
-                PROJECTION: {proj_pct:.1f}%
+                ASSET: {data_payload["reservoir"]} | RISK: {data_payload["risk_status"]}
+                CURRENT UTIL: {data_payload["utilization"]:.1f}%
+                PROJECTION: {data_payload["projected_pct"]:.1f}%
                 ACTION: Contact {c_name} for immediate localized contingency.
                 """
                 st.code(alert_code, language="markdown")
             else:
-                st.info(f"No specific collector mapping found for {sel_state}.")
+                st.info(f"No specific collector mapping found for {data_payload['state']}.")
         else:
             st.error("Column 'State' not detected in Collector CSV.")
     else:
         st.success("✅ Protocol Status: System Nominal.")
 
-with c_ai:
-    st.subheader("🤖 AI Intelligence Briefing")
+@st.fragment
+def ai_briefing_panel(data_payload):
     # This button now uses the premium CSS hover effects
     if st.button("Generate Detailed Strategic Report"):
         with st.spinner("Synthesizing multi-modal hydrological data..."):
-            prompt = f"""
-            Act as a Senior Hydrological Engineer. Provide a briefing for:
-            Reservoir: {sel_res}, State: {sel_state}
-            Current: {current_storage} BCM ({utilization:.1f}% full).
-            Risk: {risk_status}. Forecast: {proj_pct:.1f}% in {f_months} months.
-
-            Provide 4 structured sections:
-            1. 📊 SITUATION: Current state analysis.
-            2. 🔍 PREDICTIVE: Implications of the {proj_pct:.1f}% projection.
-            3. ⚙️ OPERATIONAL: Gate/Release recommendations.
-            4. ⚠️ SUMMARY: Final security statement.
-            """
             try:
-                response = client.chat.completions.create(
-                    model="Qwen/Qwen2.5-7B-Instruct",
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                report = response.choices[0].message.content
-                st.markdown(f'<div class="ai-report-box">{report}</div>', unsafe_allow_html=True)
+                prompt = build_briefing_prompt(**data_payload)
+                key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+                ai_cache = st.session_state.setdefault("_ai_cache", {})
+                placeholder = st.empty()
+                if key in ai_cache:
+                    placeholder.markdown(f'<div class="ai-report-box">{ai_cache[key]}</div>', unsafe_allow_html=True)
+                else:
+                    # Render tokens as they arrive; only a completed report is cached
+                    parts = []
+                    for delta in stream_briefing(prompt):
+                        parts.append(delta)
+                        placeholder.markdown(f'<div class="ai-report-box">{"".join(parts)}</div>', unsafe_allow_html=True)
+                    ai_cache[key] = "".join(parts)
             except Exception as e:
-                st.error(f"Intelligence Module Error: {str(e)}")
\ No newline at end of file
+                st.error(f"Intelligence Module Error: {str(e)}")
+
+data_payload = {
+    "reservoir": sel_res,
+    "state": sel_state,
+    "current_storage": current_storage,
+    "utilization": utilization,
+    "risk_status": risk_status,
+    "projected_pct": proj_pct,
+    "months": f_months,
+}
+
+st.markdown("---")
+c_alert, c_ai = st.columns(2)
+
+with c_alert:
+    st.subheader("📢 Administrative Protocol")
+    admin_protocol_panel(data_payload)
+
+with c_ai:
+    st.subheader("🤖 AI Intelligence Briefing")
+    ai_briefing_panel(data_payload)
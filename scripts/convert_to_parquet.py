@@ -0,0 +1,45 @@
+import pandas as pd
+import os
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+
+WORKBOOKS = ["cwc_reservoirs.xlsx", "climate.xlsx"]
+
+# --------------------------------------------------
+# CONVERT
+# --------------------------------------------------
+
+def convert_workbook(xlsx_path):
+    if not os.path.exists(xlsx_path):
+        raise FileNotFoundError(f"File not found at {xlsx_path}")
+    
+    df = pd.read_excel(xlsx_path)
+    
+    # Strip headers so dashboard column pruning matches exactly
+    df.columns = df.columns.str.strip()
+    
+    parquet_path = os.path.splitext(xlsx_path)[0] + ".parquet"
+    df.to_parquet(parquet_path, engine="pyarrow", compression="zstd", index=False)
+    print(f"Converted {xlsx_path} -> {parquet_path}")
+    return parquet_path
+
+
+# --------------------------------------------------
+# MAIN
+# --------------------------------------------------
+
+def run_conversion():
+    
+    for name in WORKBOOKS:
+        convert_workbook(os.path.join(DATA_DIR, name))
+    
+    print("Parquet Conversion Completed Successfully.")
+
+
+if __name__ == "__main__":
+    run_conversion()
@@ -1,13 +1,70 @@
-import requests
-
-# Get weather for Tiruppur, India
-url = "https://api.open-meteo.com/v1/forecast"
-params = {
-    "latitude": 11.1085,
-    "longitude": 77.3411,
-    "current_weather": True
-}
-
-response = requests.get(url, params=params)
-data = response.json()
-print(data["current_weather"])
\ No newline at end of file
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+
+URL = "https://api.open-meteo.com/v1/forecast"
+WEATHER_SAVE_PATH = "data/raw/weather_current.parquet"
+
+# Repeated calls within 10 minutes are answered from the on-disk cache
+session = CachedSession("meteo_cache", backend="sqlite", expire_after=600)
+
+# Keep-alive pool with short retries; (connect, read) timeouts avoid hanging on stalls
+session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+TIMEOUT = (2, 5)
+
+# --------------------------------------------------
+# FETCH
+# --------------------------------------------------
+
+def fetch_current_weather(latitude, longitude):
+    params = {
+        "latitude": latitude,
+        "longitude": longitude,
+        "current_weather": True
+    }
+    
+    response = session.get(URL, params=params, timeout=TIMEOUT)
+    response.raise_for_status()
+    return response.json()["current_weather"]
+
+
+def fetch_weather_batch(locations):
+    import pandas as pd
+    
+    # Fan out over the pooled session; one worker per kept-alive connection
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda loc: fetch_current_weather(*loc), locations))
+    
+    df = pd.DataFrame(results)
+    df.insert(0, "latitude", [lat for lat, _ in locations])
+    df.insert(1, "longitude", [lon for _, lon in locations])
+    return df
+
+
+# --------------------------------------------------
+# SAVE
+# --------------------------------------------------
+
+def save_weather(df, filepath):
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    df.to_parquet(filepath, engine="pyarrow", compression="snappy", index=False)
+    print(f"Weather Data Saved to {filepath}")
+
+
+if __name__ == "__main__":
+    # Get weather for Tiruppur, India
+    weather = fetch_weather_batch([(11.1085, 77.3411)])
+    print(weather)
+    save_weather(weather, WEATHER_SAVE_PATH)
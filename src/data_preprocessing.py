@@ -1,5 +1,3 @@
-import pandas as pd
-import numpy as np
 import os
 
 # --------------------------------------------------
@@ -7,7 +5,8 @@ import os
 # --------------------------------------------------
 
 RAW_DATA_PATH = "data/raw/reservoir_data.csv"
-PROCESSED_DATA_PATH = "data/processed/clean_reservoir_data.csv"
+# Point this at a .csv path to fall back to plain-text output
+PROCESSED_DATA_PATH = "data/processed/clean_reservoir_data.parquet"
 
 # --------------------------------------------------
 # STEP 1: LOAD DATA
@@ -17,7 +16,10 @@ def load_data(filepath):
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"File not found at {filepath}")
     
-    df = pd.read_csv(filepath)
+    import pyarrow.csv as pa_csv
+    
+    # Multithreaded Arrow parser; ISO dates arrive as datetime64, whatever the header casing
+    df = pa_csv.read_csv(filepath).to_pandas(date_as_object=False)
     print("Raw Data Loaded Successfully.")
     print(df.head())
     return df
@@ -28,6 +30,7 @@ def load_data(filepath):
 # --------------------------------------------------
 
 def clean_data(df):
+    import pandas as pd
     
     # Standardize column names
     df.columns = df.columns.str.strip().str.lower()
@@ -39,22 +42,28 @@ def clean_data(df):
         if col not in df.columns:
             raise ValueError(f"Missing required column: {col}")
     
-    # Convert date
-    df["date"] = pd.to_datetime(df["date"])
+    # Convert date (only when the reader could not type it)
+    if not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        df["date"] = pd.to_datetime(df["date"])
     
-    # Sort by date
-    df = df.sort_values("date")
+    # One row per date; a later entry for the same day replaces the earlier one
+    # (done before sorting, so fewer rows are sorted)
+    df = df.drop_duplicates(subset=["date"], keep="last")
     
-    # Remove duplicates
-    df = df.drop_duplicates()
+    # Sort by date (skipped when the log is already chronological)
+    if not df["date"].is_monotonic_increasing:
+        df = df.sort_values("date", kind="mergesort", ignore_index=True)
     
     # Handle missing values
-    df = df.fillna(method="ffill")
+    df = df.ffill()
     
-    # Remove unrealistic values
-    df = df[df["storage"] >= 0]
-    df = df[df["inflow"] >= 0]
-    df = df[df["release"] >= 0]
+    # Remove unrealistic values in a single pass
+    mask = (
+        (df["storage"].to_numpy() >= 0)
+        & (df["inflow"].to_numpy() >= 0)
+        & (df["release"].to_numpy() >= 0)
+    )
+    df = df.loc[mask]
     
     print("Data Cleaning Completed.")
     return df
@@ -82,7 +91,10 @@ def feature_engineering(df):
 
 def save_data(df, filepath):
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    df.to_csv(filepath, index=False)
+    if filepath.endswith(".csv"):
+        df.to_csv(filepath, index=False)
+    else:
+        df.to_parquet(filepath, engine="pyarrow", compression="snappy", index=False)
     print(f"Processed Data Saved to {filepath}")
 
 
@@ -1,38 +1,31 @@
-import pandas as pd
 import numpy as np
-import joblib
-import os
 
-from sklearn.metrics import mean_absolute_error, r2_score
+from model_io import feature_matrix, load_frame, load_model
 
 # --------------------------------------------------
 # CONFIG
 # --------------------------------------------------
 
 MODEL_PATH = "models/reservoir_model.pkl"
-DATA_PATH = "data/processed/clean_reservoir_data.csv"
+DATA_PATH = "data/processed/clean_reservoir_data.parquet"
+COLUMNS = ["inflow", "rainfall", "storage", "release", "next_day_storage"]
 
 # --------------------------------------------------
 # LOAD
 # --------------------------------------------------
 
-def load_model(path):
-    return joblib.load(path)
-
 def load_data(path):
-    return pd.read_csv(path)
+    return load_frame(path, COLUMNS)
 
 # --------------------------------------------------
 # FORECAST METRICS
 # --------------------------------------------------
 
-def forecast_accuracy(model, df):
+def forecast_accuracy(predictions, df):
+    from sklearn.metrics import mean_absolute_error, r2_score
     
-    X = df[["inflow", "rainfall", "storage", "release"]]
     y_true = df["next_day_storage"]
     
-    predictions = model.predict(X)
-    
     mae = mean_absolute_error(y_true, predictions)
     r2 = r2_score(y_true, predictions)
     
@@ -44,15 +37,12 @@ def forecast_accuracy(model, df):
 # RISK DETECTION METRIC
 # --------------------------------------------------
 
-def risk_detection_accuracy(model, df):
+def risk_detection_accuracy(predictions, df):
     
-    X = df[["inflow", "rainfall", "storage", "release"]]
-    predictions = model.predict(X)
-    
-    actual_flood = df["next_day_storage"] > 95
+    actual_flood = df["next_day_storage"].to_numpy() > 95
     predicted_flood = predictions > 95
     
-    correct = np.sum(actual_flood == predicted_flood)
+    correct = np.count_nonzero(actual_flood == predicted_flood)
     accuracy = (correct / len(df)) * 100
     
     return round(accuracy, 2)
@@ -61,33 +51,23 @@ def risk_detection_accuracy(model, df):
 # DECISION EFFECTIVENESS
 # --------------------------------------------------
 
-def decision_effectiveness(model, df):
-    
-    X = df[["inflow", "rainfall", "storage", "release"]]
-    baseline = model.predict(X)
-    
-    optimized = []
-    
-    for i in range(len(df)):
-        row = df.iloc[i]
-        predicted = baseline[i]
-        
-        if predicted > 95:
-            new_release = row["release"] * 1.5
-        else:
-            new_release = row["release"]
-        
-        adjusted = (
-            row["storage"]
-            + (row["inflow"] / 1000)
-            - (new_release / 1000)
-            - 0.15
-        )
-        
-        optimized.append(adjusted)
-    
-    baseline_overflow = sum(1 for x in baseline if x > 95)
-    optimized_overflow = sum(1 for x in optimized if x > 95)
+def decision_effectiveness(baseline, df):
+    
+    storage = df["storage"].to_numpy(dtype=float)
+    inflow = df["inflow"].to_numpy(dtype=float)
+    release = df["release"].to_numpy(dtype=float)
+    
+    new_release = np.where(baseline > 95, release * 1.5, release)
+    
+    optimized = (
+        storage
+        + (inflow / 1000)
+        - (new_release / 1000)
+        - 0.15
+    )
+    
+    baseline_overflow = np.count_nonzero(baseline > 95)
+    optimized_overflow = np.count_nonzero(optimized > 95)
     
     if baseline_overflow == 0:
         return 100
@@ -97,17 +77,14 @@ def decision_effectiveness(model, df):
     return round(reduction, 2)
 
 # --------------------------------------------------
-# RUN FULL EVALUATION
+# METRICS REPORT
 # --------------------------------------------------
 
-def run_evaluation():
-    
-    model = load_model(MODEL_PATH)
-    df = load_data(DATA_PATH)
+def report_evaluation(predictions, df):
     
-    mae, r2, forecast_acc = forecast_accuracy(model, df)
-    risk_acc = risk_detection_accuracy(model, df)
-    decision_score = decision_effectiveness(model, df)
+    mae, r2, forecast_acc = forecast_accuracy(predictions, df)
+    risk_acc = risk_detection_accuracy(predictions, df)
+    decision_score = decision_effectiveness(predictions, df)
     
     print("\n--- FINAL SYSTEM METRICS ---\n")
     print(f"Forecast MAE              : {mae}")
@@ -115,6 +92,21 @@ def run_evaluation():
     print(f"Forecast Accuracy (%)     : {forecast_acc}%")
     print(f"Risk Detection Accuracy   : {risk_acc}%")
     print(f"Decision Effectiveness    : {decision_score}%")
+
+# --------------------------------------------------
+# RUN FULL EVALUATION
+# --------------------------------------------------
+
+def run_evaluation():
+    
+    model = load_model(MODEL_PATH)
+    df = load_data(DATA_PATH)
+    
+    # Predicted once and shared by every metric
+    X = feature_matrix(df)
+    predictions = model.predict(X)
+    
+    report_evaluation(predictions, df)
     
     print("\nPhase 5 Completed Successfully.")
 
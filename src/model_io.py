@@ -0,0 +1,40 @@
+import numpy as np
+import os
+
+from functools import lru_cache
+
+# --------------------------------------------------
+# LOAD MODEL
+# --------------------------------------------------
+
+# One process-wide cache shared by every phase and run_all
+@lru_cache(maxsize=None)
+def load_model(path):
+    import joblib
+    
+    if not os.path.exists(path):
+        raise FileNotFoundError("Model not found. Run Phase 2 first.")
+    return joblib.load(path)
+
+
+# --------------------------------------------------
+# LOAD DATA
+# --------------------------------------------------
+
+def load_frame(path, columns):
+    import pandas as pd
+    
+    if path.endswith(".csv"):
+        return pd.read_csv(path, usecols=columns)
+    return pd.read_parquet(path, columns=columns)
+
+
+# --------------------------------------------------
+# FEATURES
+# --------------------------------------------------
+
+FEATURES = ["inflow", "rainfall", "storage", "release"]
+
+def feature_matrix(df):
+    # One contiguous float32 block; skips DataFrame validation in sklearn
+    return np.ascontiguousarray(df[FEATURES].to_numpy(dtype=np.float32))
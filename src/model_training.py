@@ -1,17 +1,14 @@
-import pandas as pd
 import numpy as np
 import os
-import joblib
 
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from sklearn.model_selection import train_test_split
+from model_io import feature_matrix, load_frame
 
 # --------------------------------------------------
 # CONFIG
 # --------------------------------------------------
 
-PROCESSED_DATA_PATH = "data/processed/clean_reservoir_data.csv"
+PROCESSED_DATA_PATH = "data/processed/clean_reservoir_data.parquet"
+COLUMNS = ["inflow", "rainfall", "storage", "release", "next_day_storage"]
 MODEL_SAVE_PATH = "models/reservoir_model.pkl"
 
 # --------------------------------------------------
@@ -22,7 +19,7 @@ def load_processed_data(filepath):
     if not os.path.exists(filepath):
         raise FileNotFoundError("Processed dataset not found. Run Phase 1 first.")
     
-    df = pd.read_csv(filepath)
+    df = load_frame(filepath, COLUMNS)
     print("Processed dataset loaded successfully.")
     return df
 
@@ -32,9 +29,12 @@ def load_processed_data(filepath):
 # --------------------------------------------------
 
 def train_model(df):
+    from sklearn.ensemble import HistGradientBoostingRegressor
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+    from sklearn.model_selection import train_test_split
     
     # Features and target
-    X = df[["inflow", "rainfall", "storage", "release"]]
+    X = feature_matrix(df)
     y = df["next_day_storage"]
     
     # Time-series split (no shuffle)
@@ -42,9 +42,12 @@ def train_model(df):
         X, y, test_size=0.2, shuffle=False
     )
     
-    model = RandomForestRegressor(
-        n_estimators=200,
+    # Boosted trees on binned features: far cheaper to predict than a deep forest
+    model = HistGradientBoostingRegressor(
+        max_iter=300,
         max_depth=8,
+        learning_rate=0.05,
+        early_stopping=True,
         random_state=42
     )
     
@@ -70,8 +73,10 @@ def train_model(df):
 # --------------------------------------------------
 
 def save_model(model, filepath):
+    import joblib
+    
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    joblib.dump(model, filepath)
+    joblib.dump(model, filepath, compress=3)
     print(f"Model saved at {filepath}")
 
 
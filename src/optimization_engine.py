@@ -1,31 +1,21 @@
-import pandas as pd
 import numpy as np
-import joblib
-import os
+
+from model_io import feature_matrix, load_frame, load_model
 
 # --------------------------------------------------
 # CONFIG
 # --------------------------------------------------
 
 MODEL_PATH = "models/reservoir_model.pkl"
-DATA_PATH = "data/processed/clean_reservoir_data.csv"
-
-# --------------------------------------------------
-# LOAD MODEL
-# --------------------------------------------------
-
-def load_model(path):
-    if not os.path.exists(path):
-        raise FileNotFoundError("Model not found. Run Phase 2 first.")
-    return joblib.load(path)
-
+DATA_PATH = "data/processed/clean_reservoir_data.parquet"
+COLUMNS = ["inflow", "rainfall", "storage", "release"]
 
 # --------------------------------------------------
 # LOAD DATA
 # --------------------------------------------------
 
 def load_data(path):
-    return pd.read_csv(path)
+    return load_frame(path, COLUMNS)
 
 
 # --------------------------------------------------
@@ -36,18 +26,24 @@ def recommend_release(predicted_storage, current_release):
     
     ideal_target = 75
     
-    if predicted_storage > 95:
-        new_release = current_release * 1.5
-    elif predicted_storage > 80:
-        new_release = current_release * 1.2
-    elif predicted_storage >= 60:
-        new_release = current_release
-    elif predicted_storage >= 40:
-        new_release = current_release * 0.8
-    else:
-        new_release = current_release * 0.6
+    # Works element-wise on scalars or aligned arrays
+    predicted_storage = np.asarray(predicted_storage, dtype=float)
+    current_release = np.asarray(current_release, dtype=float)
+    
+    # Pick a release multiplier per day, then scale once
+    factor = np.select(
+        [
+            predicted_storage > 95,
+            predicted_storage > 80,
+            predicted_storage >= 60,
+            predicted_storage >= 40,
+        ],
+        [1.5, 1.2, 1.0, 0.8],
+        default=0.6
+    )
     
-    return round(new_release, 2)
+    factor *= current_release
+    return np.round(factor, 2, out=factor)
 
 
 # --------------------------------------------------
@@ -56,36 +52,30 @@ def recommend_release(predicted_storage, current_release):
 
 def simulate_decision_effect(df, model):
     
-    X = df[["inflow", "rainfall", "storage", "release"]]
+    X = feature_matrix(df)
     
     baseline_predictions = model.predict(X)
     
-    optimized_predictions = []
-    optimized_release_values = []
-    
-    for i in range(len(df)):
-        row = df.iloc[i]
-        predicted_storage = baseline_predictions[i]
-        
-        new_release = recommend_release(
-            predicted_storage,
-            row["release"]
-        )
-        
-        # Simulate effect of new release
-        adjusted_storage = (
-            row["storage"]
-            + (row["inflow"] / 1000)
-            - (new_release / 1000)
-            - 0.15
-        )
-        
-        adjusted_storage = max(0, min(100, adjusted_storage))
-        
-        optimized_predictions.append(adjusted_storage)
-        optimized_release_values.append(new_release)
-    
-    return baseline_predictions, optimized_predictions
+    return baseline_predictions, simulate_from_predictions(baseline_predictions, df)
+
+
+def simulate_from_predictions(baseline_predictions, df):
+    
+    storage = df["storage"].to_numpy(dtype=float)
+    inflow = df["inflow"].to_numpy(dtype=float)
+    release = df["release"].to_numpy(dtype=float)
+    
+    optimized_release_values = recommend_release(baseline_predictions, release)
+    
+    # Simulate effect of new release, updating one buffer in place
+    optimized_predictions = inflow / 1000
+    optimized_predictions += storage
+    optimized_release_values /= 1000
+    optimized_predictions -= optimized_release_values
+    optimized_predictions -= 0.15
+    np.clip(optimized_predictions, 0, 100, out=optimized_predictions)
+    
+    return optimized_predictions
 
 
 # --------------------------------------------------
@@ -94,8 +84,8 @@ def simulate_decision_effect(df, model):
 
 def calculate_effectiveness(baseline, optimized):
     
-    baseline_overflow = sum(1 for x in baseline if x > 95)
-    optimized_overflow = sum(1 for x in optimized if x > 95)
+    baseline_overflow = np.count_nonzero(np.asarray(baseline) > 95)
+    optimized_overflow = np.count_nonzero(np.asarray(optimized) > 95)
     
     if baseline_overflow == 0:
         return 100
@@ -105,6 +95,18 @@ def calculate_effectiveness(baseline, optimized):
     return round(reduction, 2)
 
 
+# --------------------------------------------------
+# REPORT
+# --------------------------------------------------
+
+def report_optimization(baseline, optimized):
+    
+    score = calculate_effectiveness(baseline, optimized)
+    
+    print("\n--- DECISION EFFECTIVENESS ---")
+    print(f"Overflow Reduction Score: {score}%")
+
+
 # --------------------------------------------------
 # MAIN
 # --------------------------------------------------
@@ -116,10 +118,7 @@ def run_optimization():
     
     baseline, optimized = simulate_decision_effect(df, model)
     
-    score = calculate_effectiveness(baseline, optimized)
-    
-    print("\n--- DECISION EFFECTIVENESS ---")
-    print(f"Overflow Reduction Score: {score}%")
+    report_optimization(baseline, optimized)
     
     print("\nPhase 3 Completed Successfully.")
 
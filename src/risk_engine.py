@@ -1,25 +1,25 @@
-import pandas as pd
-import joblib
-import os
+import numpy as np
+
+from model_io import feature_matrix, load_frame, load_model
 
 # --------------------------------------------------
 # CONFIG
 # --------------------------------------------------
 
 MODEL_PATH = "models/reservoir_model.pkl"
-DATA_PATH = "data/processed/clean_reservoir_data.csv"
+DATA_PATH = "data/processed/clean_reservoir_data.parquet"
+COLUMNS = ["inflow", "rainfall", "storage", "release"]
+
+# Risk codes (int8) and their report labels, indexed by code
+SAFE, FLOOD_RISK, DROUGHT_RISK = 0, 1, 2
+RISK_LABELS = np.array(["SAFE", "FLOOD RISK", "DROUGHT RISK"])
 
 # --------------------------------------------------
 # LOAD
 # --------------------------------------------------
 
-def load_model(path):
-    if not os.path.exists(path):
-        raise FileNotFoundError("Model not found. Run Phase 2 first.")
-    return joblib.load(path)
-
 def load_data(path):
-    return pd.read_csv(path)
+    return load_frame(path, COLUMNS)
 
 # --------------------------------------------------
 # RISK CLASSIFICATION
@@ -27,44 +27,41 @@ def load_data(path):
 
 def classify_risk(predicted_storage, rainfall):
     
-    if predicted_storage > 95:
-        return "FLOOD RISK"
-    
-    if predicted_storage < 25 and rainfall < 5:
-        return "DROUGHT RISK"
+    # Works element-wise on scalars or aligned arrays
+    predicted_storage = np.asarray(predicted_storage)
+    rainfall = np.asarray(rainfall)
     
-    return "SAFE"
+    return np.select(
+        [
+            predicted_storage > 95,
+            (predicted_storage < 25) & (rainfall < 5),
+        ],
+        [FLOOD_RISK, DROUGHT_RISK],
+        default=SAFE
+    ).astype(np.int8)
 
 # --------------------------------------------------
-# RUN RISK ANALYSIS
+# RISK REPORT
 # --------------------------------------------------
 
-def run_risk_detection():
+def report_risk(predictions, df):
     
-    model = load_model(MODEL_PATH)
-    df = load_data(DATA_PATH)
-    
-    X = df[["inflow", "rainfall", "storage", "release"]]
-    
-    predictions = model.predict(X)
+    risks = classify_risk(predictions, df["rainfall"].to_numpy())
     
-    flood_count = 0
-    drought_count = 0
+    counts = np.bincount(risks, minlength=len(RISK_LABELS))
+    flood_count = int(counts[FLOOD_RISK])
+    drought_count = int(counts[DROUGHT_RISK])
     
     print("\n--- RISK ANALYSIS REPORT ---\n")
     
-    for i in range(len(df)):
-        risk = classify_risk(predictions[i], df.iloc[i]["rainfall"])
-        
-        if risk == "FLOOD RISK":
-            flood_count += 1
-        
-        if risk == "DROUGHT RISK":
-            drought_count += 1
-        
-        print(
-            f"Day {i+1} | Predicted Storage: {predictions[i]:.2f}% | Risk: {risk}"
+    # Build the whole report first and write it in one call
+    report = "\n".join(
+        f"Day {day} | Predicted Storage: {predicted:.2f}% | Risk: {risk}"
+        for day, (predicted, risk) in enumerate(
+            zip(predictions, RISK_LABELS[risks]), start=1
         )
+    )
+    print(report)
     
     total_days = len(df)
     
@@ -74,6 +71,22 @@ def run_risk_detection():
     print("\n--- RISK SUMMARY ---")
     print(f"Flood Risk Days   : {flood_count} ({flood_percent:.2f}%)")
     print(f"Drought Risk Days : {drought_count} ({drought_percent:.2f}%)")
+
+
+# --------------------------------------------------
+# RUN RISK ANALYSIS
+# --------------------------------------------------
+
+def run_risk_detection():
+    
+    model = load_model(MODEL_PATH)
+    df = load_data(DATA_PATH)
+    
+    X = feature_matrix(df)
+    
+    predictions = model.predict(X)
+    
+    report_risk(predictions, df)
     
     print("\nPhase 4 Completed Successfully.")
 
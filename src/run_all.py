@@ -0,0 +1,38 @@
+import evaluation
+import model_io
+import optimization_engine
+import risk_engine
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+
+MODEL_PATH = evaluation.MODEL_PATH
+DATA_PATH = evaluation.DATA_PATH
+
+# --------------------------------------------------
+# MAIN
+# --------------------------------------------------
+
+def run_all():
+    
+    # Phases 3-5 share one model load, one data load and one predict
+    model = model_io.load_model(MODEL_PATH)
+    df = evaluation.load_data(DATA_PATH)
+    
+    X = model_io.feature_matrix(df)
+    predictions = model.predict(X)
+    
+    optimized = optimization_engine.simulate_from_predictions(predictions, df)
+    optimization_engine.report_optimization(predictions, optimized)
+    print("\nPhase 3 Completed Successfully.")
+    
+    risk_engine.report_risk(predictions, df)
+    print("\nPhase 4 Completed Successfully.")
+    
+    evaluation.report_evaluation(predictions, df)
+    print("\nPhase 5 Completed Successfully.")
+
+
+if __name__ == "__main__":
+    run_all()